@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os, sys, time, logging
+import io
+import os, sys, time, random, asyncio, logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, List
 
+import aiohttp
+import orjson
 import requests
-import pandas as pd
+from aiolimiter import AsyncLimiter
+from requests.adapters import HTTPAdapter
+import pyarrow as pa
 from zoneinfo import ZoneInfo
 from google.cloud import bigquery
+from google.cloud import bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types as bq_storage_types, writer
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 
 # ---------------- CONFIG ----------------
 API_KEY = os.environ["ODDS_API_KEY"]  # must be set via Cloud Run Job env/secret
@@ -20,14 +30,22 @@ LOCAL_TZ = ZoneInfo("America/Toronto")
 
 TIMEOUT = 30
 MAX_RETRIES = 4
-EVENT_CALL_DELAY_SEC = 0.18
+MAX_CONCURRENT_EVENT_CALLS = 8  # keep in-flight requests under the provider rate limit
+BACKOFF_BASE_SEC = 0.5
+BACKOFF_CAP_SEC = 30.0
+
+# Pre-shape the request rate to the provider quota so we never see a 429,
+# instead of reacting to them with retries.
+RATE_LIMIT_CALLS = 50
+RATE_LIMIT_PERIOD_SEC = 60
+LIMITER = AsyncLimiter(max_rate=RATE_LIMIT_CALLS, time_period=RATE_LIMIT_PERIOD_SEC)
 
 PROJECT_ID = "nhl25-473523"
 DATASET = "betting_odds"
 TABLE = "nhl_player_odds_current"  # append-only
 FULL_TABLE = f"{PROJECT_ID}.{DATASET}.{TABLE}"
 
-ALLOWED_BOOKMAKERS = {"BetMGM", "BetRivers", "DraftKings", "Fanatics", "FanDuel", "Pinnacle"}
+ALLOWED_BOOKMAKERS = frozenset({"BetMGM", "BetRivers", "DraftKings", "Fanatics", "FanDuel", "Pinnacle"})
 
 # Seed with bulk to get event ids cheaply
 SEED_MARKETS = ["h2h"]
@@ -66,70 +84,249 @@ def bq_client() -> bigquery.Client:
     return bigquery.Client(project=PROJECT_ID)
 
 
+def bq_write_client() -> bigquery_storage_v1.BigQueryWriteClient:
+    return bigquery_storage_v1.BigQueryWriteClient()
+
+
+# Single source of truth for the table shape; the proto and Arrow schemas
+# used by the upload path are derived from it below.
+SCHEMA: List[bigquery.SchemaField] = [
+    bigquery.SchemaField("fetch_ts_utc", "TIMESTAMP"),
+    bigquery.SchemaField("event_id", "STRING"),
+    bigquery.SchemaField("sport_key", "STRING"),
+    bigquery.SchemaField("commence_time_utc", "TIMESTAMP"),
+    bigquery.SchemaField("commence_time_local", "TIMESTAMP"),
+    bigquery.SchemaField("home_team", "STRING"),
+    bigquery.SchemaField("away_team", "STRING"),
+    bigquery.SchemaField("bookmaker_key", "STRING"),
+    bigquery.SchemaField("bookmaker_title", "STRING"),
+    bigquery.SchemaField("bookmaker_last_update_utc", "TIMESTAMP"),
+    bigquery.SchemaField("market_key", "STRING"),
+    bigquery.SchemaField("base_market_key", "STRING"),
+    bigquery.SchemaField("is_alternate", "BOOL"),
+    bigquery.SchemaField("market_last_update_utc", "TIMESTAMP"),
+    bigquery.SchemaField("player", "STRING"),
+    bigquery.SchemaField("outcome_name", "STRING"),
+    bigquery.SchemaField("outcome_side", "STRING"),
+    bigquery.SchemaField("price_american", "INT64"),
+    bigquery.SchemaField("point", "FLOAT64"),
+    bigquery.SchemaField("regions_requested", "STRING"),
+    bigquery.SchemaField("odds_format", "STRING"),
+]
+
+_FDP = descriptor_pb2.FieldDescriptorProto
+
+# BQ type → proto wire type; TIMESTAMP travels as epoch microseconds (int64)
+_PROTO_TYPES = {
+    "TIMESTAMP": _FDP.TYPE_INT64,
+    "STRING": _FDP.TYPE_STRING,
+    "BOOL": _FDP.TYPE_BOOL,
+    "BOOLEAN": _FDP.TYPE_BOOL,
+    "INT64": _FDP.TYPE_INT64,
+    "INTEGER": _FDP.TYPE_INT64,
+    "FLOAT64": _FDP.TYPE_DOUBLE,
+    "FLOAT": _FDP.TYPE_DOUBLE,
+}
+
+_ARROW_TYPES = {
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    "STRING": pa.string(),
+    "BOOL": pa.bool_(),
+    "BOOLEAN": pa.bool_(),
+    "INT64": pa.int64(),
+    "INTEGER": pa.int64(),
+    "FLOAT64": pa.float64(),
+    "FLOAT": pa.float64(),
+}
+
+ROW_PROTO_FIELDS = [(f.name, _PROTO_TYPES[f.field_type]) for f in SCHEMA]
+ARROW_SCHEMA = pa.schema([(f.name, _ARROW_TYPES[f.field_type]) for f in SCHEMA])
+
+
+def _build_row_message():
+    fdp = descriptor_pb2.FileDescriptorProto(
+        name="nhl_player_odds_row.proto", package="nhlprops", syntax="proto2"
+    )
+    msg = fdp.message_type.add()
+    msg.name = "OddsRow"
+    for idx, (name, ftype) in enumerate(ROW_PROTO_FIELDS, start=1):
+        msg.field.add(name=name, number=idx, type=ftype, label=_FDP.LABEL_OPTIONAL)
+    fd = descriptor_pool.DescriptorPool().Add(fdp)
+    return message_factory.GetMessageClass(fd.message_types_by_name["OddsRow"])
+
+
+OddsRow = _build_row_message()
+
+APPEND_BATCH_ROWS = 2000  # keeps each AppendRows request well under the 10 MB limit
+
+
+def _serialize_row(row: Dict[str, Any]) -> bytes:
+    msg = OddsRow()
+    for name, ftype in ROW_PROTO_FIELDS:
+        v = row.get(name)
+        if v is None:
+            continue
+        if isinstance(v, datetime):
+            v = int(v.timestamp() * 1_000_000)
+        elif ftype == _FDP.TYPE_INT64:
+            v = int(v)
+        elif ftype == _FDP.TYPE_DOUBLE:
+            v = float(v)
+        elif ftype == _FDP.TYPE_BOOL:
+            v = bool(v)
+        setattr(msg, name, v)
+    return msg.SerializeToString()
+
+
 def ensure_table_simple(client: bigquery.Client):
-    schema = [
-        bigquery.SchemaField("fetch_ts_utc", "TIMESTAMP"),
-        bigquery.SchemaField("event_id", "STRING"),
-        bigquery.SchemaField("sport_key", "STRING"),
-        bigquery.SchemaField("commence_time_utc", "TIMESTAMP"),
-        bigquery.SchemaField("commence_time_local", "TIMESTAMP"),
-        bigquery.SchemaField("home_team", "STRING"),
-        bigquery.SchemaField("away_team", "STRING"),
-        bigquery.SchemaField("bookmaker_key", "STRING"),
-        bigquery.SchemaField("bookmaker_title", "STRING"),
-        bigquery.SchemaField("bookmaker_last_update_utc", "TIMESTAMP"),
-        bigquery.SchemaField("market_key", "STRING"),
-        bigquery.SchemaField("base_market_key", "STRING"),
-        bigquery.SchemaField("is_alternate", "BOOL"),
-        bigquery.SchemaField("market_last_update_utc", "TIMESTAMP"),
-        bigquery.SchemaField("player", "STRING"),
-        bigquery.SchemaField("outcome_name", "STRING"),
-        bigquery.SchemaField("outcome_side", "STRING"),
-        bigquery.SchemaField("price_american", "INT64"),
-        bigquery.SchemaField("point", "FLOAT64"),
-        bigquery.SchemaField("regions_requested", "STRING"),
-        bigquery.SchemaField("odds_format", "STRING"),
-    ]
     try:
         client.get_table(FULL_TABLE)
         logging.info("Table exists: %s", FULL_TABLE)
     except Exception:
-        client.create_table(bigquery.Table(FULL_TABLE, schema=schema))
-        logging.info("Created table (no partitioning): %s", FULL_TABLE)
+        table = bigquery.Table(FULL_TABLE, schema=SCHEMA)
+        # day partitions + clustering let downstream queries prune instead of
+        # scanning the whole append-only history
+        table.time_partitioning = bigquery.TimePartitioning(field="fetch_ts_utc")
+        table.clustering_fields = ["event_id", "bookmaker_key", "market_key"]
+        client.create_table(table)
+        logging.info("Created table (partitioned by fetch_ts_utc, clustered): %s", FULL_TABLE)
 
 
-def upload_append(client: bigquery.Client, df: pd.DataFrame):
-    if df.empty:
-        logging.warning("No rows to upload.")
-        return
+def _upload_ndjson(client: bigquery.Client, table: pa.Table):
+    """
+    Fallback load path: rows as newline-delimited JSON via a load job. orjson
+    serializes the row dicts (datetimes included) directly, so no Arrow →
+    Parquet conversion is needed to produce the payload.
+    """
+    buf = io.BytesIO()
+    for row in table.to_pylist():
+        buf.write(orjson.dumps(row, option=orjson.OPT_UTC_Z))
+        buf.write(b"\n")
+    buf.seek(0)
 
     job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+        schema=SCHEMA,
         write_disposition="WRITE_APPEND",
-        schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION],
     )
-    job = client.load_table_from_dataframe(df, FULL_TABLE, job_config=job_config)
+    job = client.load_table_from_file(buf, FULL_TABLE, job_config=job_config)
     job.result()
-    logging.info("Uploaded %d rows → %s", len(df), FULL_TABLE)
+
+
+def upload_append(client: bigquery.Client, write_client: bigquery_storage_v1.BigQueryWriteClient, table: pa.Table):
+    """
+    Append via the Storage Write API default stream: rows go straight into the
+    table with sub-second commits, skipping load-job orchestration entirely.
+    Falls back to an NDJSON load job if the write stream is unavailable
+    (e.g. the service account lacks the Storage Write role).
+    """
+    if table.num_rows == 0:
+        logging.warning("No rows to upload.")
+        return
+
+    try:
+        _append_rows(write_client, table)
+    except Exception as e:
+        logging.warning("Storage Write append failed (%s); falling back to NDJSON load job", e)
+        _upload_ndjson(client, table)
+
+    logging.info("Uploaded %d rows → %s", table.num_rows, FULL_TABLE)
+
+
+def _append_rows(write_client: bigquery_storage_v1.BigQueryWriteClient, table: pa.Table):
+    stream_name = write_client.table_path(PROJECT_ID, DATASET, TABLE) + "/_default"
+
+    proto_schema = bq_storage_types.ProtoSchema()
+    OddsRow.DESCRIPTOR.CopyToProto(proto_schema.proto_descriptor)
+
+    request_template = bq_storage_types.AppendRowsRequest()
+    request_template.write_stream = stream_name
+    proto_data = bq_storage_types.AppendRowsRequest.ProtoData()
+    proto_data.writer_schema = proto_schema
+    request_template.proto_rows = proto_data
+
+    append_stream = writer.AppendRowsStream(write_client, request_template)
+    try:
+        futures = []
+        for start in range(0, table.num_rows, APPEND_BATCH_ROWS):
+            chunk = table.slice(start, APPEND_BATCH_ROWS)
+            proto_rows = bq_storage_types.ProtoRows()
+            for row in chunk.to_pylist():
+                proto_rows.serialized_rows.append(_serialize_row(row))
+
+            request = bq_storage_types.AppendRowsRequest()
+            request.proto_rows = bq_storage_types.AppendRowsRequest.ProtoData(rows=proto_rows)
+            futures.append(append_stream.send(request))
+
+        for fut in futures:
+            fut.result()
+    finally:
+        append_stream.close()
 
 
 # ---------- HTTP ----------
+# keep-alive pool for the sync calls: reuses TCP/TLS instead of paying a
+# fresh handshake per request
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+def retry_delay(prev: float, status: int | None, retry_after: str | None) -> float:
+    """
+    Decorrelated-jitter backoff: random in [base, min(cap, prev*3)] so concurrent
+    callers don't retry in lockstep. On 429 the API tells us exactly how long to
+    wait via Retry-After, so honor that instead of guessing.
+    """
+    if status == 429 and retry_after:
+        try:
+            return min(BACKOFF_CAP_SEC, float(retry_after))
+        except ValueError:
+            pass
+    return random.uniform(BACKOFF_BASE_SEC, min(BACKOFF_CAP_SEC, prev * 3))
+
+
 def http_get(url: str, params: Dict[str, Any]) -> requests.Response:
+    delay = BACKOFF_BASE_SEC
     for i in range(MAX_RETRIES):
         try:
-            r = requests.get(url, params=params, timeout=TIMEOUT)
+            r = SESSION.get(url, params=params, timeout=TIMEOUT)
             if r.status_code == 200:
                 return r
             log.warning("HTTP %s try %d: %s", r.status_code, i + 1, r.text[:300])
+            delay = retry_delay(delay, r.status_code, r.headers.get("Retry-After"))
         except requests.RequestException as e:
             log.warning("ReqEx try %d: %s", i + 1, e)
-        time.sleep(1.5 * (i + 1))
+            delay = retry_delay(delay, None, None)
+        time.sleep(delay)
 
-    r = requests.get(url, params=params, timeout=TIMEOUT)
+    r = SESSION.get(url, params=params, timeout=TIMEOUT)
     if r.status_code != 200:
         raise RuntimeError(f"GET failed {r.status_code}: {r.text[:500]}")
     return r
 
 
+async def http_get_async(session: aiohttp.ClientSession, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    delay = BACKOFF_BASE_SEC
+    for i in range(MAX_RETRIES):
+        try:
+            async with LIMITER:
+                async with session.get(url, params=params) as r:
+                    if r.status == 200:
+                        return orjson.loads(await r.read())
+                    log.warning("HTTP %s try %d: %s", r.status, i + 1, (await r.text())[:300])
+                    delay = retry_delay(delay, r.status, r.headers.get("Retry-After"))
+        except aiohttp.ClientError as e:
+            log.warning("ReqEx try %d: %s", i + 1, e)
+            delay = retry_delay(delay, None, None)
+        await asyncio.sleep(delay)
+
+    async with LIMITER:
+        async with session.get(url, params=params) as r:
+            if r.status != 200:
+                raise RuntimeError(f"GET failed {r.status}: {(await r.text())[:500]}")
+            return orjson.loads(await r.read())
+
+
 # ---------- Fetchers ----------
 def fetch_seed_events() -> List[Dict[str, Any]]:
     url = f"{API_HOST}/sports/{SPORT}/odds"
@@ -140,10 +337,48 @@ def fetch_seed_events() -> List[Dict[str, Any]]:
         "apiKey": API_KEY,
     }
     log.info("Seeding events via bulk %s", params["markets"])
-    return http_get(url, params).json()
+    return orjson.loads(http_get(url, params).content)
 
 
-def fetch_event_props(event_id: str, markets: List[str]) -> Dict[str, Any]:
+def fetch_bulk_props() -> List[Dict[str, Any]] | None:
+    """
+    One bulk /odds call can cover every event in a single response if the API
+    accepts player markets there (historically it only does for featured
+    markets). Probe with a single un-retried request; on anything other than a
+    usable props payload, return None and let the caller do per-event calls.
+    """
+    url = f"{API_HOST}/sports/{SPORT}/odds"
+    params = {
+        "regions": REGIONS,
+        "markets": ",".join(PLAYER_MARKETS),
+        "oddsFormat": ODDS_FORMAT,
+        "apiKey": API_KEY,
+    }
+    try:
+        r = SESSION.get(url, params=params, timeout=TIMEOUT)
+    except requests.RequestException as e:
+        log.info("Bulk props probe failed (%s); using per-event calls", e)
+        return None
+    if r.status_code != 200:
+        log.info("Bulk player markets rejected (HTTP %s); using per-event calls", r.status_code)
+        return None
+
+    events = orjson.loads(r.content)
+    has_props = any(
+        str(mk.get("key", "")).startswith("player_")
+        for ev in events
+        for bm in ev.get("bookmakers", [])
+        for mk in bm.get("markets", [])
+    )
+    if not has_props:
+        log.info("Bulk response carries no player markets; using per-event calls")
+        return None
+
+    log.info("Bulk call covered %d events", len(events))
+    return events
+
+
+async def fetch_event_props(session: aiohttp.ClientSession, event_id: str, markets: List[str]) -> Dict[str, Any]:
     url = f"{API_HOST}/sports/{SPORT}/events/{event_id}/odds"
     params = {
         "regions": REGIONS,
@@ -151,46 +386,39 @@ def fetch_event_props(event_id: str, markets: List[str]) -> Dict[str, Any]:
         "oddsFormat": ODDS_FORMAT,
         "apiKey": API_KEY,
     }
-    return http_get(url, params).json()
+    return await http_get_async(session, url, params)
 
 
 # ---------- Helpers ----------
-OVER_WORDS = {"over", "o"}
-UNDER_WORDS = {"under", "u"}
-YES_WORDS = {"yes", "y"}
-NO_WORDS = {"no", "n"}
+_SIDE_MAP = {
+    "over": "OVER", "o": "OVER",
+    "under": "UNDER", "u": "UNDER",
+    "yes": "YES", "y": "YES",
+    "no": "NO", "n": "NO",
+}
 
 
 def side_from_outcome_name(name: str) -> str:
     if not name:
         return "UNKNOWN"
-    low = name.strip().lower()
-    if low in OVER_WORDS:
-        return "OVER"
-    if low in UNDER_WORDS:
-        return "UNDER"
-    if low in YES_WORDS:
-        return "YES"
-    if low in NO_WORDS:
-        return "NO"
-    return "PLAYER"  # goalscorer or rare labels
-
-
-def extract_player(oc: Dict[str, Any], market_key: str) -> str | None:
+    # one dict probe instead of four set-membership checks
+    return _SIDE_MAP.get(name.strip().lower(), "PLAYER")  # PLAYER: goalscorer or rare labels
+
+
+def extract_player(oc: Dict[str, Any], market_key: str, side: str) -> str | None:
     """
     Priority:
       1) description (common for O/U props)
       2) participant (some books)
       3) if goalscorer markets → outcome name when it's not Over/Under/Yes/No
+    (`side` is the already-computed tag for the outcome name.)
     """
     if oc.get("description"):
         return str(oc["description"])
     if oc.get("participant"):
         return str(oc["participant"])
-    if market_key.startswith("player_goal_scorer"):
-        nm = str(oc.get("name", "")).strip()
-        if side_from_outcome_name(nm) == "PLAYER":
-            return nm
+    if market_key.startswith("player_goal_scorer") and side == "PLAYER":
+        return str(oc.get("name", "")).strip()
     return None
 
 
@@ -199,98 +427,159 @@ def base_market_key(mkey: str) -> str:
     return mkey[:-10] if mkey.endswith("_alternate") else mkey
 
 
+@lru_cache(maxsize=8192)
+def _parse_iso(s: str) -> datetime:
+    # bookmakers repeat the same last_update string across dozens of markets,
+    # so memoizing makes most parses a cache hit
+    if len(s) == 20 and s[19] == "Z":
+        # fast path for the API's fixed YYYY-MM-DDTHH:MM:SSZ format: direct
+        # construction skips the ISO parser and the tz conversion
+        return datetime(
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[14:16]), int(s[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
 # ---------- Normalize ----------
-def normalize(event: Dict[str, Any]) -> pd.DataFrame:
-    rows = []
+# column order for the row tuples built in normalize
+COLUMNS = ARROW_SCHEMA.names
+
+# shared zero-row table so empty events skip column building entirely
+EMPTY_TABLE = ARROW_SCHEMA.empty_table()
+
+
+def normalize(event: Dict[str, Any]) -> pa.Table:
+    books = [bm for bm in event.get("bookmakers", []) if bm.get("title") in ALLOWED_BOOKMAKERS]
+    if not books:
+        return EMPTY_TABLE
+
+    # keyed by the stable outcome identity: duplicate books across the
+    # requested regions (us,eu,us_ex) can emit the same outcome twice
+    rows: Dict[tuple, tuple] = {}
     fetched_at = datetime.now(timezone.utc)
 
     ev_id = event["id"]
-    commence = datetime.fromisoformat(event["commence_time"].replace("Z", "+00:00")).astimezone(timezone.utc)
+    commence = _parse_iso(event["commence_time"])
     commence_local = commence.astimezone(LOCAL_TZ)
     home, away = event["home_team"], event["away_team"]
     sport_key = event.get("sport_key", "icehockey_nhl")
+    regions, odds_format = REGIONS, ODDS_FORMAT
 
-    for bm in event.get("bookmakers", []):
-        if bm.get("title") not in ALLOWED_BOOKMAKERS:
-            continue
-
+    for bm in books:
+        bm_title = bm.get("title")
+        bm_key = bm.get("key")
         bm_last = bm.get("last_update")
-        bm_last_dt = datetime.fromisoformat(bm_last.replace("Z", "+00:00")).astimezone(timezone.utc) if bm_last else None
+        bm_last_dt = _parse_iso(bm_last) if bm_last else None
 
         for mk in bm.get("markets", []):
             mkey = mk.get("key")
-            if not mkey or not mkey.startswith("player_"):
+            if not mkey or mkey[:7] != "player_":  # slice compare beats startswith dispatch here
                 continue
 
             mlast = mk.get("last_update")
-            mlast_dt = datetime.fromisoformat(mlast.replace("Z", "+00:00")).astimezone(timezone.utc) if mlast else None
+            mlast_dt = _parse_iso(mlast) if mlast else None
 
             is_alt = mkey.endswith("_alternate")
             fam_key = base_market_key(mkey)
 
             for oc in mk.get("outcomes", []):
-                player = extract_player(oc, mkey)
                 outcome_name = oc.get("name")
                 side = side_from_outcome_name(outcome_name or "")
+                player = extract_player(oc, mkey, side)
+                point = oc.get("point")
+
+                key = (bm_key, mkey, player, outcome_name, point)
+                rows[key] = (
+                    fetched_at, ev_id, sport_key, commence, commence_local,
+                    home, away, bm_key, bm_title, bm_last_dt,
+                    mkey, fam_key, is_alt, mlast_dt,
+                    player, outcome_name, side, oc.get("price"), point,
+                    regions, odds_format,
+                )
 
-                rows.append({
-                    "fetch_ts_utc": fetched_at,
-                    "event_id": ev_id,
-                    "sport_key": sport_key,
-                    "commence_time_utc": commence,
-                    "commence_time_local": commence_local,
-                    "home_team": home,
-                    "away_team": away,
-                    "bookmaker_key": bm.get("key"),
-                    "bookmaker_title": bm.get("title"),
-                    "bookmaker_last_update_utc": bm_last_dt,
-                    "market_key": mkey,                  # exact key from API
-                    "base_market_key": fam_key,          # normalized family (no _alternate)
-                    "is_alternate": is_alt,              # TRUE for alternate ladders
-                    "market_last_update_utc": mlast_dt,
-                    "player": player,
-                    "outcome_name": outcome_name,
-                    "outcome_side": side,                # OVER/UNDER/YES/NO/PLAYER
-                    "price_american": oc.get("price"),
-                    "point": oc.get("point") if "point" in oc else None,
-                    "regions_requested": REGIONS,
-                    "odds_format": ODDS_FORMAT,
-                })
-
-    return pd.DataFrame(rows)
+    # columnar build straight into Arrow: no pandas round-trip, no object
+    # dtypes, and concat/slice downstream are zero-copy
+    vals = list(rows.values())
+    cols = list(map(list, zip(*vals))) if vals else [[] for _ in COLUMNS]
+    return pa.Table.from_pydict(dict(zip(COLUMNS, cols)), schema=ARROW_SCHEMA)
 
 
 # ---------- Main ----------
-def main():
+async def main():
     logging.info("🎯 NHL player props (core + alternates) → BQ (append-only)")
     client = bq_client()
+    write_client = bq_write_client()
     ensure_table_simple(client)
 
-    events = fetch_seed_events()
-    logging.info("Events: %d", len(events))
-
-    total = 0
-    for ev in events:
-        try:
-            payload = fetch_event_props(ev["id"], PLAYER_MARKETS)
-
-            # use seed event metadata but swap in the per-event bookmakers (props response)
-            event_full = {**ev, "bookmakers": payload.get("bookmakers", [])}
+    # Cheapest path first: one bulk call instead of N per-event round-trips.
+    events = fetch_bulk_props()
+    if events is not None:
+        payloads: List[Any] = events  # bookmakers already inline per event
+    else:
+        events = fetch_seed_events()
+        logging.info("Events: %d", len(events))
+
+        sem = asyncio.Semaphore(MAX_CONCURRENT_EVENT_CALLS)
+        timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+
+        payloads = []
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            # Probe the first event with the full market list, then only ask
+            # for markets the books actually offer right now: smaller requests,
+            # smaller responses, less JSON to parse on every remaining event.
+            markets = PLAYER_MARKETS
+            if events:
+                try:
+                    first: Any = await fetch_event_props(session, events[0]["id"], markets)
+                    supported = {
+                        mk.get("key")
+                        for bm in first.get("bookmakers", [])
+                        for mk in bm.get("markets", [])
+                    }
+                    trimmed = [m for m in PLAYER_MARKETS if m in supported]
+                    if trimmed and len(trimmed) < len(PLAYER_MARKETS):
+                        log.info("Markets offered now: %d/%d", len(trimmed), len(PLAYER_MARKETS))
+                        markets = trimmed
+                except Exception as e:
+                    first = e
+
+                async def bounded(event_id: str) -> Dict[str, Any]:
+                    async with sem:
+                        return await fetch_event_props(session, event_id, markets)
+
+                rest = await asyncio.gather(
+                    *(bounded(ev["id"]) for ev in events[1:]), return_exceptions=True
+                )
+                payloads = [first, *rest]
+
+    event_fulls: List[Dict[str, Any]] = []
+    for ev, payload in zip(events, payloads):
+        if isinstance(payload, BaseException):
+            logging.warning("props fetch failed %s: %s", ev.get("id"), payload)
+            continue
 
-            df = normalize(event_full)
-            upload_append(client, df)
-            total += len(df)
+        # use seed event metadata but swap in the per-event bookmakers (props response)
+        event_fulls.append({**ev, "bookmakers": payload.get("bookmakers", [])})
 
-        except Exception as e:
-            logging.warning("props fetch failed %s: %s", ev.get("id"), e)
+    # normalization of independent events is pure-Python CPU work; fan it out
+    # across cores (a pool isn't worth spinning up for a single event)
+    if len(event_fulls) > 1:
+        with ProcessPoolExecutor() as ex:
+            tables = list(ex.map(normalize, event_fulls))
+    else:
+        tables = [normalize(ef) for ef in event_fulls]
 
-        time.sleep(EVENT_CALL_DELAY_SEC)
+    # one append per run: amortizes upload overhead over all events
+    final = pa.concat_tables(tables) if tables else ARROW_SCHEMA.empty_table()
+    upload_append(client, write_client, final)
 
-    logging.info("✅ Done. Rows uploaded: %d", total)
+    logging.info("✅ Done. Rows uploaded: %d", final.num_rows)
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         sys.exit(130)